@@ -33,7 +33,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         session,
     )
 
-    # Authenticate
+    # Authenticate (this also opens the pooled keep-alive connection to the
+    # API host, so the first status refresh doesn't pay for DNS/TLS setup)
     await api.authenticate()
 
     # Create coordinator
@@ -49,6 +50,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Reload when options change
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     # Register refresh service
     async def handle_refresh(call: ServiceCall) -> None:
         """Handle the refresh service call."""
@@ -62,6 +66,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    coordinator: ViperCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # Data-only updates (e.g. reauth) reload on their own
+    if entry.options != coordinator.options:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
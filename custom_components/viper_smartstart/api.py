@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any
 
@@ -22,6 +24,49 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Re-authenticate this many seconds before the token expires
+TOKEN_REFRESH_MARGIN = 60
+# Expirations further out than this are treated as unknown
+MAX_TOKEN_LIFETIME = 365 * 24 * 3600
+
+# Maximum number of vehicles whose status is fetched at the same time
+MAX_CONCURRENT_VEHICLES = 8
+
+# Pre-serialized command bodies; only the device ID is filled in per call
+_CMD_TEMPLATES: dict[str, bytes] = {
+    cmd: b'{"command":"' + cmd.encode() + b'","deviceId":%s}'
+    for cmd in (CMD_ARM, CMD_DISARM, CMD_REMOTE, CMD_READ_ACTIVE, CMD_READ_CURRENT)
+}
+
+# (API key, VehicleStatus attribute) pairs copied from each status response
+_ACTIVE_NUM_FIELDS = (
+    ("speed", "speed"),
+    ("heading", "heading"),
+    ("batteryVoltage", "battery_voltage"),
+)
+_ACTIVE_BOOL_FIELDS = (
+    ("doorsOpen", "doors_open"),
+    ("ignitionOn", "ignition_on"),
+    ("trunkOpen", "trunk_open"),
+    ("hoodOpen", "hood_open"),
+)
+_CURRENT_BOOL_FIELDS = (
+    ("doorsLocked", "doors_locked"),
+    ("remoteStarterActive", "remote_starter_active"),
+    ("securitySystemArmed", "security_system_armed"),
+    ("panicOn", "panic_on"),
+    ("valetOn", "valet_on"),
+)
+
+
+def _device_payload(result: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return the device data and its deviceStatus from a command response."""
+    try:
+        device = result["results"]["device"]
+    except (KeyError, TypeError):
+        return {}, {}
+    return device, device.get("deviceStatus") or {}
+
 
 class ViperAuthError(Exception):
     """Authentication error."""
@@ -31,7 +76,7 @@ class ViperApiError(Exception):
     """API error."""
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleStatus:
     """Vehicle status data."""
 
@@ -51,7 +96,7 @@ class VehicleStatus:
     valet_on: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Vehicle:
     """Vehicle data."""
 
@@ -63,6 +108,60 @@ class Vehicle:
     status: VehicleStatus | None = None
 
 
+def _parse_vehicle_status(
+    device_id: str,
+    active_result: dict[str, Any] | None,
+    current_result: dict[str, Any] | None,
+) -> VehicleStatus:
+    """Build a VehicleStatus from the active and current status responses."""
+    _LOGGER.debug("Active result for %s: %s", device_id, active_result)
+    _LOGGER.debug("Current result for %s: %s", device_id, current_result)
+
+    status = VehicleStatus()
+
+    # Process active status (GPS, door state, ignition, etc.)
+    if active_result is not None:
+        active_data, active_status = _device_payload(active_result)
+
+        # Parse latitude/longitude
+        lat = active_data.get("latitude")
+        lon = active_data.get("longitude")
+        if lat is not None:
+            try:
+                status.latitude = float(lat)
+            except (ValueError, TypeError):
+                pass
+        if lon is not None:
+            try:
+                status.longitude = float(lon)
+            except (ValueError, TypeError):
+                pass
+
+        for api_key, attr in _ACTIVE_NUM_FIELDS:
+            setattr(status, attr, active_data.get(api_key))
+
+        # Door/vehicle states from active status
+        for api_key, attr in _ACTIVE_BOOL_FIELDS:
+            value = active_status.get(api_key)
+            if value is not None:
+                setattr(status, attr, bool(value))
+    else:
+        _LOGGER.warning("No active status for device %s", device_id)
+
+    # Process current status (remote starter, security system, etc.)
+    if current_result is not None:
+        _, current_status = _device_payload(current_result)
+
+        for api_key, attr in _CURRENT_BOOL_FIELDS:
+            value = current_status.get(api_key)
+            if value is not None:
+                setattr(status, attr, bool(value))
+    else:
+        _LOGGER.warning("No current status for device %s", device_id)
+
+    return status
+
+
 class ViperApi:
     """Viper SmartStart API client."""
 
@@ -78,12 +177,31 @@ class ViperApi:
         self._session = session
         self._access_token: str | None = None
         self._token_expiration: int | None = None
+        self._expiration_warned = False
+        self._auth_headers: dict[str, str] | None = None
+        self._command_headers: dict[str, str] | None = None
+        self._auth_lock = asyncio.Lock()
+        self._vehicle_semaphore = asyncio.Semaphore(MAX_CONCURRENT_VEHICLES)
+        # Whether the backend accepts several commands in one request
+        # (None until detected on first use)
+        self._bulk_supported: bool | None = None
+        self._bulk_lock = asyncio.Lock()
         self._own_session = False
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            # Pooled keep-alive connector so commands reuse the TLS connection
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30, connect=10),
+            )
             self._own_session = True
         return self._session
 
@@ -124,7 +242,14 @@ class ViperApi:
                     raise ViperAuthError("Invalid authentication response")
 
                 self._access_token = data["results"]["authToken"]["accessToken"]
-                self._token_expiration = data["results"]["authToken"]["expiration"]
+                self._token_expiration = self._parse_expiration(
+                    data["results"]["authToken"].get("expiration")
+                )
+                self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
+                self._command_headers = {
+                    **self._auth_headers,
+                    "Content-Type": "application/json",
+                }
                 _LOGGER.debug("Authentication successful")
                 return True
 
@@ -135,14 +260,92 @@ class ViperApi:
             _LOGGER.debug("Connection error during auth: %s", err)
             raise ViperApiError(f"Connection error: {err}") from err
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get authorization headers."""
+    def _parse_expiration(self, value: Any) -> int | None:
+        """Normalize the token expiration to epoch seconds.
+
+        Returns None (rely on 401-driven refresh) if the value isn't an
+        absolute timestamp in the near future.
+        """
+        if isinstance(value, str) and value.isdigit():
+            value = int(value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            expiration = int(value)
+            # Milliseconds rather than seconds
+            if expiration > 10_000_000_000:
+                expiration //= 1000
+            now = time.time()
+            if now < expiration <= now + MAX_TOKEN_LIFETIME:
+                return expiration
+
+        if not self._expiration_warned:
+            self._expiration_warned = True
+            _LOGGER.debug(
+                "Unrecognized token expiration %r, refreshing only on 401", value
+            )
+        return None
+
+    def _token_expiring(self) -> bool:
+        """Check if the token is missing or about to expire."""
         if not self._access_token:
+            return True
+        return bool(
+            self._token_expiration
+            and time.time() + TOKEN_REFRESH_MARGIN >= self._token_expiration
+        )
+
+    async def ensure_authenticated(self) -> None:
+        """Authenticate if there is no token or it is about to expire.
+
+        Concurrent callers share a single login.
+        """
+        if not self._token_expiring():
+            return
+        async with self._auth_lock:
+            # Another request may have refreshed the token while we waited
+            if self._token_expiring():
+                _LOGGER.debug("Access token missing or expiring, re-authenticating")
+                await self.authenticate()
+
+    async def _reauthenticate(self, rejected_token: str | None) -> None:
+        """Re-authenticate after the API rejected a token.
+
+        Concurrent requests rejected with the same token share one login.
+        """
+        async with self._auth_lock:
+            if self._access_token in (rejected_token, None):
+                _LOGGER.debug("Access token rejected, re-authenticating")
+                await self.authenticate()
+
+    async def _handle_rejected_token(
+        self, rejected_token: str | None, retry: bool
+    ) -> None:
+        """Re-authenticate after a 401 if a retry is allowed, otherwise raise."""
+        if not retry:
+            self._invalidate_token()
+            raise ViperAuthError("Token expired")
+        await self._reauthenticate(rejected_token)
+
+    def _get_headers(self) -> dict[str, str]:
+        """Get authorization headers (cached until re-authentication)."""
+        if not self._auth_headers:
             raise ViperAuthError("Not authenticated")
-        return {"Authorization": f"Bearer {self._access_token}"}
+        return self._auth_headers
+
+    def _get_command_headers(self) -> dict[str, str]:
+        """Get authorization headers for a pre-serialized JSON body."""
+        if not self._command_headers:
+            raise ViperAuthError("Not authenticated")
+        return self._command_headers
+
+    def _invalidate_token(self) -> None:
+        """Drop the cached token so the next update re-authenticates."""
+        self._access_token = None
+        self._auth_headers = None
+        self._command_headers = None
 
     async def get_vehicles(self) -> list[Vehicle]:
         """Get list of vehicles."""
+        await self.ensure_authenticated()
         session = await self._get_session()
 
         try:
@@ -151,6 +354,7 @@ class ViperApi:
                 headers=self._get_headers(),
             ) as response:
                 if response.status == 401:
+                    self._invalidate_token()
                     raise ViperAuthError("Token expired")
                 if response.status != 200:
                     raise ViperApiError(f"API error: {response.status}")
@@ -175,103 +379,171 @@ class ViperApi:
         except aiohttp.ClientError as err:
             raise ViperApiError(f"Connection error: {err}") from err
 
-    async def _send_command(self, device_id: str, command: str) -> dict[str, Any]:
-        """Send a command to a vehicle."""
+    async def _send_command(
+        self, device_id: str, command: str, _retry: bool = True
+    ) -> dict[str, Any]:
+        """Send a command to a vehicle, re-authenticating once on a 401."""
+        await self.ensure_authenticated()
         session = await self._get_session()
+        token = self._access_token
+
+        template = _CMD_TEMPLATES.get(command)
+        if template is not None:
+            body = template % json.dumps(device_id).encode()
+        else:
+            body = json.dumps({"command": command, "deviceId": device_id}).encode()
+
+        try:
+            async with session.post(
+                API_COMMAND_URL,
+                headers=self._get_command_headers(),
+                data=body,
+            ) as response:
+                if response.status != 401:
+                    if response.status != 200:
+                        raise ViperApiError(f"Command failed: {response.status}")
+                    return await response.json()
+
+        except aiohttp.ClientError as err:
+            raise ViperApiError(f"Connection error: {err}") from err
+        except asyncio.TimeoutError as err:
+            raise ViperApiError("Request timed out") from err
+        except ValueError as err:
+            raise ViperApiError(f"Invalid response: {err}") from err
+
+        # Token rejected; the response has been released before logging in
+        await self._handle_rejected_token(token, _retry)
+        return await self._send_command(device_id, command, _retry=False)
+
+    def _bulk_unsupported(self, reason: str) -> None:
+        """Turn batched commands off while still detecting support.
+
+        Once the backend has accepted them, a failure is a real API error.
+        """
+        if self._bulk_supported:
+            raise ViperApiError(reason)
+        _LOGGER.debug(
+            "Batched commands not supported (%s), using single commands", reason
+        )
+        self._bulk_supported = False
+
+    async def _send_commands_bulk(
+        self, device_id: str, commands: list[str], _retry: bool = True
+    ) -> list[dict[str, Any]] | None:
+        """Send several commands in one request.
+
+        Returns None if the backend turns out not to support batched
+        commands.
+        """
+        await self.ensure_authenticated()
+        session = await self._get_session()
+        token = self._access_token
 
         try:
             async with session.post(
                 API_COMMAND_URL,
                 headers=self._get_headers(),
-                json={"command": command, "deviceId": device_id},
+                json={"commands": commands, "deviceId": device_id},
             ) as response:
-                if response.status == 401:
-                    raise ViperAuthError("Token expired")
-                if response.status != 200:
-                    raise ViperApiError(f"Command failed: {response.status}")
+                rejected = response.status == 401
+                if response.status not in (200, 401):
+                    self._bulk_unsupported(f"Command failed: {response.status}")
+                    return None
 
-                return await response.json()
+                if not rejected:
+                    data = await response.json()
 
+        except aiohttp.ContentTypeError as err:
+            self._bulk_unsupported(f"Invalid response format: {err}")
+            return None
         except aiohttp.ClientError as err:
             raise ViperApiError(f"Connection error: {err}") from err
+        except asyncio.TimeoutError as err:
+            raise ViperApiError("Request timed out") from err
+        except ValueError as err:
+            raise ViperApiError(f"Invalid response: {err}") from err
+
+        if rejected:
+            # The response has been released before logging in
+            await self._handle_rejected_token(token, _retry)
+            return await self._send_commands_bulk(device_id, commands, _retry=False)
+
+        # Accept either a bare list or the usual envelope holding a list
+        results = data.get("results") if isinstance(data, dict) else data
+        if not isinstance(results, list) or len(results) != len(commands):
+            _LOGGER.debug("Unexpected batched command response: %s", data)
+            self._bulk_unsupported("Unexpected batched command response")
+            return None
+
+        self._bulk_supported = True
+        return [
+            result if isinstance(result, dict) and "results" in result
+            else {"results": result}
+            for result in results
+        ]
+
+    async def _read_status(
+        self, device_id: str, command: str
+    ) -> dict[str, Any] | None:
+        """Send a status read, returning None on API errors.
+
+        Auth errors are raised so the caller can re-authenticate.
+        """
+        try:
+            return await self._send_command(device_id, command)
+        except ViperApiError as err:
+            _LOGGER.warning(
+                "Failed to get %s status for device %s: %s", command, device_id, err
+            )
+            return None
 
     async def get_vehicle_status(self, device_id: str) -> VehicleStatus:
         """Get vehicle status by combining active and current status."""
-        # Fetch both status types concurrently
-        active_task = self._send_command(device_id, CMD_READ_ACTIVE)
-        current_task = self._send_command(device_id, CMD_READ_CURRENT)
-
-        active_result, current_result = await asyncio.gather(
-            active_task, current_task, return_exceptions=True
-        )
-
-        _LOGGER.debug("Active result for %s: %s", device_id, active_result)
-        _LOGGER.debug("Current result for %s: %s", device_id, current_result)
-
-        status = VehicleStatus()
-
-        # Process active status (GPS, door state, ignition, etc.)
-        if not isinstance(active_result, Exception) and active_result is not None:
-            active_data = active_result.get("results", {}).get("device", {})
-            active_status = active_data.get("deviceStatus", {})
-
-            # Parse latitude/longitude
-            lat = active_data.get("latitude")
-            lon = active_data.get("longitude")
-            if lat is not None:
-                try:
-                    status.latitude = float(lat)
-                except (ValueError, TypeError):
-                    pass
-            if lon is not None:
-                try:
-                    status.longitude = float(lon)
-                except (ValueError, TypeError):
-                    pass
-
-            status.speed = active_data.get("speed")
-            status.heading = active_data.get("heading")
-            status.battery_voltage = active_data.get("batteryVoltage")
-
-            # Door/vehicle states from active status
-            if active_status.get("doorsOpen") is not None:
-                status.doors_open = bool(active_status.get("doorsOpen"))
-            if active_status.get("ignitionOn") is not None:
-                status.ignition_on = bool(active_status.get("ignitionOn"))
-            if active_status.get("trunkOpen") is not None:
-                status.trunk_open = bool(active_status.get("trunkOpen"))
-            if active_status.get("hoodOpen") is not None:
-                status.hood_open = bool(active_status.get("hoodOpen"))
-        elif active_result is None:
-            _LOGGER.warning("Active status returned None for device %s", device_id)
+        commands = [CMD_READ_ACTIVE, CMD_READ_CURRENT]
+        results = None
+        if self._bulk_supported is None:
+            # Probe once; other vehicles wait for the outcome instead of
+            # each spending a call on detection
+            async with self._bulk_lock:
+                if self._bulk_supported is None:
+                    results = await self._send_commands_bulk(device_id, commands)
+        if results is None and self._bulk_supported:
+            results = await self._send_commands_bulk(device_id, commands)
+
+        if results is not None:
+            active_result, current_result = results
         else:
-            _LOGGER.warning("Failed to get active status: %s", active_result)
-
-        # Process current status (remote starter, security system, etc.)
-        if not isinstance(current_result, Exception) and current_result is not None:
-            current_data = current_result.get("results", {}).get("device", {})
-            current_status = current_data.get("deviceStatus", {})
-
-            if current_status.get("doorsLocked") is not None:
-                status.doors_locked = bool(current_status.get("doorsLocked"))
-            if current_status.get("remoteStarterActive") is not None:
-                status.remote_starter_active = bool(
-                    current_status.get("remoteStarterActive")
-                )
-            if current_status.get("securitySystemArmed") is not None:
-                status.security_system_armed = bool(
-                    current_status.get("securitySystemArmed")
-                )
-            if current_status.get("panicOn") is not None:
-                status.panic_on = bool(current_status.get("panicOn"))
-            if current_status.get("valetOn") is not None:
-                status.valet_on = bool(current_status.get("valetOn"))
-        elif current_result is None:
-            _LOGGER.warning("Current status returned None for device %s", device_id)
-        else:
-            _LOGGER.warning("Failed to get current status: %s", current_result)
-
-        return status
+            # Fetch both status types concurrently
+            active_result, current_result = await asyncio.gather(
+                self._read_status(device_id, CMD_READ_ACTIVE),
+                self._read_status(device_id, CMD_READ_CURRENT),
+            )
+            if active_result is None and current_result is None:
+                # Nothing fresh to report; let the caller keep previous data
+                raise ViperApiError(f"No status received for device {device_id}")
+
+        return _parse_vehicle_status(device_id, active_result, current_result)
+
+    async def get_all_vehicle_statuses(
+        self, device_ids: list[str]
+    ) -> dict[str, VehicleStatus | BaseException]:
+        """Get status for several vehicles concurrently.
+
+        Every vehicle's status reads are in flight at once, so a refresh
+        takes about one round trip however many vehicles there are (up to
+        MAX_CONCURRENT_VEHICLES). A failing vehicle maps to its exception
+        instead of failing the batch.
+        """
+
+        async def _fetch(device_id: str) -> VehicleStatus:
+            async with self._vehicle_semaphore:
+                return await self.get_vehicle_status(device_id)
+
+        results = await asyncio.gather(
+            *(_fetch(device_id) for device_id in device_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(device_ids, results))
 
     async def remote_start(self, device_id: str) -> bool:
         """Send remote start command."""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from itertools import chain, product
 import logging
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
@@ -57,13 +58,19 @@ async def async_setup_entry(
     """Set up Viper SmartStart buttons."""
     coordinator: ViperCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[ButtonEntity] = []
-    for vehicle_id in coordinator.get_vehicle_ids():
-        for description in BUTTONS:
-            entities.append(ViperButton(coordinator, vehicle_id, description))
-        entities.append(ViperRefreshButton(coordinator, vehicle_id))
-
-    async_add_entities(entities)
+    vehicle_ids = coordinator.get_vehicle_ids()
+    async_add_entities(
+        chain(
+            (
+                ViperButton(coordinator, vehicle_id, description)
+                for vehicle_id, description in product(vehicle_ids, BUTTONS)
+            ),
+            (
+                ViperRefreshButton(coordinator, vehicle_id)
+                for vehicle_id in vehicle_ids
+            ),
+        )
+    )
 
 
 class ViperButton(CoordinatorEntity[ViperCoordinator], ButtonEntity):
@@ -96,10 +103,8 @@ class ViperButton(CoordinatorEntity[ViperCoordinator], ButtonEntity):
             self.coordinator.api, self._vehicle_id
         )
         if success:
-            # Refresh data after command with delay
-            self.hass.async_create_task(
-                self.coordinator.async_refresh_after_action()
-            )
+            # Refresh data after command with delay (debounced)
+            await self.coordinator.async_refresh_after_action()
         else:
             _LOGGER.warning(
                 "Command %s failed for vehicle %s",
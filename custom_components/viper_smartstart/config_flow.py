@@ -8,8 +8,14 @@ from typing import Any
 import aiohttp
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
     NumberSelector,
@@ -22,8 +28,10 @@ from homeassistant.helpers.selector import (
 
 from .api import Vehicle, ViperApi, ViperApiError, ViperAuthError
 from .const import (
+    CONF_MAX_STALE,
     CONF_REFRESH_INTERVAL,
     CONF_VEHICLES,
+    DEFAULT_MAX_STALE,
     DEFAULT_REFRESH_INTERVAL,
     DOMAIN,
 )
@@ -31,6 +39,12 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def _vehicle_label(vehicle: Vehicle) -> str:
+    """Build a selector label like "Name (Year Make Model)"."""
+    details = " ".join(filter(None, (vehicle.year, vehicle.make, vehicle.model)))
+    return f"{vehicle.name} ({details})" if details else vehicle.name
+
+
 class ViperSmartStartConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Viper SmartStart."""
 
@@ -43,6 +57,12 @@ class ViperSmartStartConfigFlow(ConfigFlow, domain=DOMAIN):
         self._vehicles: list[Vehicle] = []
         self._api: ViperApi | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return ViperSmartStartOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -122,22 +142,10 @@ class ViperSmartStartConfigFlow(ConfigFlow, domain=DOMAIN):
                 )
 
         # Build vehicle options for selector
-        vehicle_options = []
-        for vehicle in self._vehicles:
-            label_parts = [vehicle.name]
-            extra_parts = []
-            if vehicle.year:
-                extra_parts.append(vehicle.year)
-            if vehicle.make:
-                extra_parts.append(vehicle.make)
-            if vehicle.model:
-                extra_parts.append(vehicle.model)
-            if extra_parts:
-                label_parts.append(f"({' '.join(extra_parts)})")
-            vehicle_options.append({
-                "value": vehicle.id,
-                "label": " ".join(label_parts),
-            })
+        vehicle_options = [
+            {"value": vehicle.id, "label": _vehicle_label(vehicle)}
+            for vehicle in self._vehicles
+        ]
 
         # Default to all vehicles selected
         default_vehicles = [v.id for v in self._vehicles]
@@ -222,3 +230,42 @@ class ViperSmartStartConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders={"username": self._username},
         )
+
+
+class ViperSmartStartOptionsFlow(OptionsFlow):
+    """Handle options for Viper SmartStart."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(
+                data={CONF_MAX_STALE: int(user_input[CONF_MAX_STALE])}
+            )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MAX_STALE,
+                        default=self._entry.options.get(
+                            CONF_MAX_STALE, DEFAULT_MAX_STALE
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=10080,
+                            step=5,
+                            unit_of_measurement="minutes",
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
+                }
+            ),
+        )
@@ -18,9 +18,11 @@ CMD_READ_CURRENT = "read_current"
 # Config keys
 CONF_REFRESH_INTERVAL = "refresh_interval"
 CONF_VEHICLES = "vehicles"
+CONF_MAX_STALE = "max_stale"
 
 # Defaults
 DEFAULT_REFRESH_INTERVAL = 0  # Disabled by default to conserve API calls (5000/year limit)
+DEFAULT_MAX_STALE = 30  # Minutes to keep serving previous data while the API fails
 
 # Services
 SERVICE_REFRESH = "refresh"
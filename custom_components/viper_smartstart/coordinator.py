@@ -4,30 +4,64 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .api import Vehicle, VehicleStatus, ViperApi, ViperApiError, ViperAuthError
-from .const import CONF_REFRESH_INTERVAL, CONF_VEHICLES, DEFAULT_REFRESH_INTERVAL, DOMAIN
+from .const import (
+    CONF_MAX_STALE,
+    CONF_REFRESH_INTERVAL,
+    CONF_VEHICLES,
+    DEFAULT_MAX_STALE,
+    DEFAULT_REFRESH_INTERVAL,
+    DOMAIN,
+)
 
 if TYPE_CHECKING:
     from homeassistant.helpers.device_registry import DeviceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
-# Boosted polling settings when remote start is active
-BOOSTED_INTERVAL = timedelta(seconds=60)
+# Adaptive polling: poll faster while vehicle state is changing and back off
+# while it is idle
+MIN_POLL_INTERVAL = timedelta(seconds=60)
+# Ceiling when automatic polling is otherwise disabled; backing off past it
+# returns to manual refresh only
+MAX_ADAPTIVE_INTERVAL = timedelta(minutes=15)
+ACTIVE_DECREASE_FACTOR = 0.5
+IDLE_INCREASE_FACTOR = 1.5
+# Unchanged polls in a row before the interval is increased
+IDLE_THRESHOLD = 2
+# Hard cap on polling faster than configured after a remote start
 BOOSTED_MAX_DURATION = timedelta(minutes=30)
 
+# Status fields whose change counts as vehicle activity
+_activity_fields = attrgetter(
+    "remote_starter_active",
+    "ignition_on",
+    "doors_locked",
+    "doors_open",
+    "trunk_open",
+    "hood_open",
+)
+
 # Delay before refreshing after an action
 ACTION_REFRESH_DELAY = 10
 
+# Polling for an expected state after an action: the delay starts here and
+# doubles each attempt, capped at ACTION_REFRESH_DELAY
+ACTION_POLL_INITIAL_DELAY = 2
+ACTION_POLL_MAX_ATTEMPTS = 4
+
 
 class ViperCoordinator(DataUpdateCoordinator[dict[str, VehicleStatus]]):
     """Coordinator to manage fetching Viper data."""
@@ -43,15 +77,38 @@ class ViperCoordinator(DataUpdateCoordinator[dict[str, VehicleStatus]]):
         """Initialize the coordinator."""
         self.api = api
         self._vehicle_ids: list[str] = config_entry.data.get(CONF_VEHICLES, [])
+        self._vehicle_id_set: frozenset[str] = frozenset(self._vehicle_ids)
         self._vehicles: dict[str, Vehicle] = {}
+        self._device_info: dict[str, DeviceInfo] = {}
 
         refresh_interval = config_entry.data.get(
             CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL
         )
         # 0 means disabled - set to None for no automatic polling
         self._normal_interval = timedelta(seconds=refresh_interval) if refresh_interval > 0 else None
+        self._min_interval = (
+            min(MIN_POLL_INTERVAL, self._normal_interval)
+            if self._normal_interval
+            else MIN_POLL_INTERVAL
+        )
+        self._max_interval = self._normal_interval or MAX_ADAPTIVE_INTERVAL
+        self._reset_msg = (
+            "Polling interval reset to disabled (manual refresh only)"
+            if self._normal_interval is None
+            else f"Polling interval reset to {self._normal_interval}"
+        )
+        self._idle_polls = 0
         self._boosted_until: datetime | None = None
+        self._update_in_progress = False
+        self._pending_action_refresh: dict[str, asyncio.Task[None]] = {}
         self._last_updated: datetime | None = None
+        # Last successful fetch per vehicle; previous data is only served
+        # while it is younger than max_stale
+        self._last_success_at: dict[str, datetime] = {}
+        self.options = dict(config_entry.options)
+        self._max_stale = timedelta(
+            minutes=self.options.get(CONF_MAX_STALE, DEFAULT_MAX_STALE)
+        )
 
         super().__init__(
             hass,
@@ -61,121 +118,180 @@ class ViperCoordinator(DataUpdateCoordinator[dict[str, VehicleStatus]]):
             update_interval=self._normal_interval,
         )
 
+        # Collapse refreshes from rapid actions into one after the delay
+        self._action_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=ACTION_REFRESH_DELAY,
+            immediate=False,
+            function=self._async_refresh_if_idle,
+        )
+
     async def _async_setup(self) -> None:
         """Set up the coordinator - fetch vehicle info."""
         try:
             vehicles = await self.api.get_vehicles()
-            self._vehicles = {v.id: v for v in vehicles if v.id in self._vehicle_ids}
+            # The API has no filter by ID, so prune client-side and stop once
+            # every configured vehicle has been found
+            self._vehicles = {}
+            for vehicle in vehicles:
+                if vehicle.id in self._vehicle_id_set:
+                    self._vehicles[vehicle.id] = vehicle
+                    if len(self._vehicles) == len(self._vehicle_id_set):
+                        break
+            self._device_info = {
+                vehicle_id: self._build_device_info(vehicle_id)
+                for vehicle_id in self._vehicle_ids
+            }
         except ViperAuthError as err:
             raise ConfigEntryAuthFailed from err
         except ViperApiError as err:
             raise UpdateFailed(f"Error fetching vehicles: {err}") from err
 
     def start_boosted_polling(self) -> None:
-        """Start boosted polling interval for remote start monitoring."""
+        """Poll at the minimum interval to monitor a remote start."""
+        self._idle_polls = 0
         self._boosted_until = dt_util.utcnow() + BOOSTED_MAX_DURATION
-        self.update_interval = BOOSTED_INTERVAL
+        self.update_interval = self._min_interval
         _LOGGER.debug(
             "Boosted polling enabled until %s (interval: %s)",
             self._boosted_until,
-            BOOSTED_INTERVAL,
+            self._min_interval,
         )
 
-    def _check_and_reset_boosted_polling(self, data: dict[str, VehicleStatus]) -> None:
-        """Check if boosted polling should be reset to normal."""
-        if self._boosted_until is None:
-            return
-
-        now = dt_util.utcnow()
-
-        # Check if max duration exceeded
-        if now >= self._boosted_until:
+    def _status_changed(self, data: dict[str, VehicleStatus]) -> bool:
+        """Check if any vehicle's state changed since the last update."""
+        if not self.data:
+            return False
+        for vehicle_id, status in data.items():
+            previous = self.data.get(vehicle_id)
+            if previous is None:
+                continue
+            if _activity_fields(status) != _activity_fields(previous):
+                return True
+        return False
+
+    def _adapt_polling_interval(
+        self, data: dict[str, VehicleStatus], current: timedelta, now: datetime
+    ) -> None:
+        """Shorten the current interval when state changes, lengthen it while idle."""
+        if self._boosted_until is not None and now >= self._boosted_until:
             _LOGGER.debug("Boosted polling max duration reached, resetting to normal")
             self._reset_to_normal_polling()
             return
 
-        # Check if any vehicle still has remote starter active
-        any_remote_active = any(
-            status.remote_starter_active
-            for status in data.values()
-            if status.remote_starter_active is not None
-        )
-
-        if not any_remote_active:
+        boosted = self._boosted_until is not None or self._normal_interval is None
+        if boosted and not any(
+            status.remote_starter_active for status in data.values()
+        ):
+            # Boosted polling just follows a remote start
             _LOGGER.debug("No vehicles have remote start active, resetting to normal polling")
             self._reset_to_normal_polling()
+            return
+
+        if self._status_changed(data):
+            self._idle_polls = 0
+            interval = max(self._min_interval, current * ACTIVE_DECREASE_FACTOR)
+        else:
+            self._idle_polls += 1
+            if self._idle_polls < IDLE_THRESHOLD:
+                return
+            self._idle_polls = 0
+            interval = current * IDLE_INCREASE_FACTOR
+            if interval > self._max_interval:
+                if self._normal_interval is None:
+                    self._reset_to_normal_polling()
+                    return
+                interval = self._max_interval
+
+        if interval != current:
+            _LOGGER.debug("Polling interval adjusted to %s", interval)
+            self.update_interval = interval
 
     def _reset_to_normal_polling(self) -> None:
         """Reset polling interval to normal (may be None if disabled)."""
+        self._idle_polls = 0
         self._boosted_until = None
         self.update_interval = self._normal_interval
-        if self._normal_interval is None:
-            _LOGGER.debug("Polling interval reset to disabled (manual refresh only)")
-        else:
-            _LOGGER.debug("Polling interval reset to %s", self._normal_interval)
+        _LOGGER.debug(self._reset_msg)
 
     @property
     def is_boosted(self) -> bool:
-        """Return True if boosted polling is active."""
-        return self._boosted_until is not None
+        """Return True if polling faster than the configured interval."""
+        return self.update_interval is not None and (
+            self._normal_interval is None
+            or self.update_interval < self._normal_interval
+        )
 
     @property
     def last_updated(self) -> datetime | None:
         """Return the last update timestamp."""
         return self._last_updated
 
+    def _cached_status(self, vehicle_id: str, now: datetime) -> VehicleStatus | None:
+        """Return the previous status if it is still within the stale window."""
+        if not self.data or vehicle_id not in self.data:
+            return None
+        last_success = self._last_success_at.get(vehicle_id)
+        if last_success is None or now - last_success >= self._max_stale:
+            return None
+        return self.data[vehicle_id]
+
     async def _async_update_data(self) -> dict[str, VehicleStatus]:
         """Fetch data from API."""
+        now = dt_util.utcnow()
+        self._update_in_progress = True
         try:
-            # Ensure we're authenticated
-            if not self.api.is_authenticated:
-                await self.api.authenticate()
+            # Ensure we're authenticated (single login shared with any
+            # concurrent command)
+            await self.api.ensure_authenticated()
 
             data: dict[str, VehicleStatus] = {}
             errors: list[str] = []
 
-            for vehicle_id in self._vehicle_ids:
-                try:
-                    status = await self.api.get_vehicle_status(vehicle_id)
-                    data[vehicle_id] = status
-                except ViperAuthError:
-                    # Re-authenticate and retry once
-                    try:
-                        await self.api.authenticate()
-                        status = await self.api.get_vehicle_status(vehicle_id)
-                        data[vehicle_id] = status
-                    except (ViperAuthError, ViperApiError) as err:
-                        errors.append(f"Vehicle {vehicle_id}: {err}")
-                        # Preserve previous data if available
-                        if self.data and vehicle_id in self.data:
-                            data[vehicle_id] = self.data[vehicle_id]
-                            _LOGGER.warning(
-                                "Failed to update vehicle %s, keeping previous data: %s",
-                                vehicle_id,
-                                err,
-                            )
-                except ViperApiError as err:
-                    errors.append(f"Vehicle {vehicle_id}: {err}")
-                    # Preserve previous data if available
-                    if self.data and vehicle_id in self.data:
-                        data[vehicle_id] = self.data[vehicle_id]
-                        _LOGGER.warning(
-                            "Failed to update vehicle %s, keeping previous data: %s",
-                            vehicle_id,
-                            err,
-                        )
-
-            # If we got no data at all and had no previous data, this is a real failure
+            # Fetch all vehicles concurrently. Commands re-authenticate and
+            # retry once on a rejected token, so an auth error here means
+            # the fresh login failed too.
+            results = await self.api.get_all_vehicle_statuses(self._vehicle_ids)
+
+            for vehicle_id, result in results.items():
+                if isinstance(result, VehicleStatus):
+                    data[vehicle_id] = result
+                    self._last_success_at[vehicle_id] = now
+                    continue
+                if not isinstance(result, Exception):
+                    # Cancellation and the like must propagate
+                    raise result
+                if not isinstance(result, (ViperAuthError, ViperApiError)):
+                    _LOGGER.error(
+                        "Unexpected error updating vehicle %s",
+                        vehicle_id,
+                        exc_info=result,
+                    )
+
+                errors.append(f"Vehicle {vehicle_id}: {result}")
+                # Preserve previous data if it isn't too old
+                if (cached := self._cached_status(vehicle_id, now)) is not None:
+                    data[vehicle_id] = cached
+                    _LOGGER.warning(
+                        "Failed to update vehicle %s, keeping previous data: %s",
+                        vehicle_id,
+                        result,
+                    )
+
+            # If we got no data at all and had no recent previous data, this is a real failure
             if not data:
                 if errors:
                     raise UpdateFailed(f"Error communicating with API: {'; '.join(errors)}")
                 raise UpdateFailed("No data received from API")
 
-            # Check if we should reset boosted polling
-            self._check_and_reset_boosted_polling(data)
+            # Adjust the polling interval to how active the vehicles are
+            # (skipped entirely in the default manual-refresh-only mode)
+            if self.update_interval is not None:
+                self._adapt_polling_interval(data, self.update_interval, now)
 
             # Update last refresh timestamp
-            self._last_updated = dt_util.now()
+            self._last_updated = now
 
             # Log if there were partial errors but we still have data
             if errors:
@@ -187,13 +303,20 @@ class ViperCoordinator(DataUpdateCoordinator[dict[str, VehicleStatus]]):
             # Authentication failed completely - this requires user action
             raise ConfigEntryAuthFailed from err
         except ViperApiError as err:
-            # If we have previous data, preserve it instead of failing
-            if self.data:
+            # If we have recent previous data, preserve it instead of failing
+            cached = {
+                vehicle_id: status
+                for vehicle_id in self._vehicle_ids
+                if (status := self._cached_status(vehicle_id, now)) is not None
+            }
+            if cached:
                 _LOGGER.warning(
                     "API error during update, keeping previous data: %s", err
                 )
-                return self.data
+                return cached
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        finally:
+            self._update_in_progress = False
 
     def get_vehicle(self, vehicle_id: str) -> Vehicle | None:
         """Get vehicle info."""
@@ -204,7 +327,15 @@ class ViperCoordinator(DataUpdateCoordinator[dict[str, VehicleStatus]]):
         return self._vehicle_ids
 
     def get_device_info(self, vehicle_id: str) -> DeviceInfo:
-        """Get device info for a vehicle."""
+        """Get device info for a vehicle (shared by all of its entities)."""
+        if (device_info := self._device_info.get(vehicle_id)) is None:
+            device_info = self._device_info[vehicle_id] = self._build_device_info(
+                vehicle_id
+            )
+        return device_info
+
+    def _build_device_info(self, vehicle_id: str) -> DeviceInfo:
+        """Build device info for a vehicle."""
         vehicle = self._vehicles.get(vehicle_id)
         name = vehicle.name if vehicle else f"Vehicle {vehicle_id}"
 
@@ -220,6 +351,7 @@ class ViperCoordinator(DataUpdateCoordinator[dict[str, VehicleStatus]]):
 
         model = " ".join(model_parts) if model_parts else None
 
+        # Built once per vehicle, so every entity shares this identifiers set
         return {
             "identifiers": {(DOMAIN, vehicle_id)},
             "name": name,
@@ -227,10 +359,110 @@ class ViperCoordinator(DataUpdateCoordinator[dict[str, VehicleStatus]]):
             "model": model,
         }
 
-    async def async_refresh_after_action(self) -> None:
-        """Schedule a refresh after an action with a delay."""
+    def _skip_extra_refresh(self, kind: str) -> bool:
+        """Check whether a regular update is already fetching fresh data."""
+        if self._update_in_progress:
+            _LOGGER.debug("Update already in progress, skipping %s", kind)
+            return True
+        return False
+
+    async def _async_refresh_if_idle(self) -> None:
+        """Refresh unless an update is already fetching fresh data."""
+        if self._skip_extra_refresh("debounced refresh"):
+            return
+        await self.async_refresh()
+
+    async def _async_refresh_vehicle(self, vehicle_id: str) -> None:
+        """Refresh one vehicle's status outside the regular update.
+
+        Used while waiting for an action to take effect, so it only reads
+        the vehicle involved and doesn't count towards adaptive polling.
+        """
+        if self._skip_extra_refresh(f"refresh of vehicle {vehicle_id}"):
+            return
+        if not self.last_update_success:
+            # Publishing one vehicle would mark the others available again
+            # with whatever status they had before the failure
+            await self.async_refresh()
+            return
+        try:
+            status = await self.api.get_vehicle_status(vehicle_id)
+        except (ViperAuthError, ViperApiError) as err:
+            _LOGGER.warning("Failed to refresh vehicle %s: %s", vehicle_id, err)
+            return
+
+        # Only this vehicle was read, so the coordinator-wide last updated
+        # time stays with the last full update
+        self._last_success_at[vehicle_id] = dt_util.utcnow()
+        self.async_set_updated_data({**(self.data or {}), vehicle_id: status})
+
+    async def async_refresh_after_action(
+        self,
+        vehicle_id: str | None = None,
+        expected: Callable[[VehicleStatus | None], bool] | None = None,
+    ) -> None:
+        """Refresh status after an action.
+
+        Without a condition this schedules one debounced refresh after
+        ACTION_REFRESH_DELAY. With one, the vehicle's status is polled with
+        backoff until it reaches the expected state or the attempts run out.
+        """
+        if expected is None:
+            _LOGGER.debug(
+                "Scheduling status refresh in %s seconds", ACTION_REFRESH_DELAY
+            )
+            await self._action_debouncer.async_call()
+            return
+
+        delay = ACTION_POLL_INITIAL_DELAY
+        for _ in range(ACTION_POLL_MAX_ATTEMPTS):
+            await asyncio.sleep(delay)
+            # A newer action may cancel this poll at any time; shield the
+            # read so requests already sent still update the vehicle.
+            await asyncio.shield(self._async_refresh_vehicle(vehicle_id))
+            if self.data and expected(self.data.get(vehicle_id)):
+                _LOGGER.debug("Vehicle %s reached the expected state", vehicle_id)
+                return
+            delay = min(delay * 2, ACTION_REFRESH_DELAY)
+
         _LOGGER.debug(
-            "Scheduling status refresh in %s seconds", ACTION_REFRESH_DELAY
+            "Vehicle %s did not reach the expected state after %s refreshes",
+            vehicle_id,
+            ACTION_POLL_MAX_ATTEMPTS,
         )
-        await asyncio.sleep(ACTION_REFRESH_DELAY)
-        await self.async_request_refresh()
+
+    def _cancel_pending_action_refresh(self, vehicle_id: str) -> None:
+        """Cancel the state polling started by a previous action on a vehicle."""
+        task = self._pending_action_refresh.pop(vehicle_id, None)
+        if task and not task.done():
+            task.cancel()
+
+    def schedule_refresh_after_action(
+        self,
+        vehicle_id: str,
+        expected: Callable[[VehicleStatus | None], bool],
+    ) -> None:
+        """Poll for the expected state in the background.
+
+        Only the latest action per vehicle is followed; polling for an
+        earlier action on the same vehicle is cancelled.
+        """
+        self._cancel_pending_action_refresh(vehicle_id)
+        task = self.hass.async_create_background_task(
+            self.async_refresh_after_action(vehicle_id, expected),
+            name=f"viper_refresh_{vehicle_id}",
+        )
+        self._pending_action_refresh[vehicle_id] = task
+
+        def _forget(done: asyncio.Task[None]) -> None:
+            if self._pending_action_refresh.get(vehicle_id) is done:
+                del self._pending_action_refresh[vehicle_id]
+
+        task.add_done_callback(_forget)
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending post-action refresh on shutdown."""
+        self._action_debouncer.async_cancel()
+        for vehicle_id in list(self._pending_action_refresh):
+            self._cancel_pending_action_refresh(vehicle_id)
+        await super().async_shutdown()
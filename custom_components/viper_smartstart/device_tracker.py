@@ -9,10 +9,10 @@ from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ViperCoordinator
+from .entity import ViperEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,17 +25,15 @@ async def async_setup_entry(
     """Set up Viper SmartStart device trackers."""
     coordinator: ViperCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[ViperDeviceTracker] = []
-    for vehicle_id in coordinator.get_vehicle_ids():
-        entities.append(ViperDeviceTracker(coordinator, vehicle_id))
+    async_add_entities(
+        ViperDeviceTracker(coordinator, vehicle_id)
+        for vehicle_id in coordinator.get_vehicle_ids()
+    )
 
-    async_add_entities(entities)
 
-
-class ViperDeviceTracker(CoordinatorEntity[ViperCoordinator], TrackerEntity):
+class ViperDeviceTracker(ViperEntity, TrackerEntity):
     """Representation of a Viper vehicle tracker."""
 
-    _attr_has_entity_name = True
     _attr_name = "Location"
 
     def __init__(
@@ -44,10 +42,8 @@ class ViperDeviceTracker(CoordinatorEntity[ViperCoordinator], TrackerEntity):
         vehicle_id: str,
     ) -> None:
         """Initialize the device tracker."""
-        super().__init__(coordinator)
-        self._vehicle_id = vehicle_id
+        super().__init__(coordinator, vehicle_id)
         self._attr_unique_id = f"{vehicle_id}_location"
-        self._attr_device_info = coordinator.get_device_info(vehicle_id)
 
     @property
     def source_type(self) -> SourceType:
@@ -57,22 +53,14 @@ class ViperDeviceTracker(CoordinatorEntity[ViperCoordinator], TrackerEntity):
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        if self.coordinator.data is None:
-            return None
-        status = self.coordinator.data.get(self._vehicle_id)
-        if status is None:
-            return None
-        return status.latitude
+        status = self._status
+        return None if status is None else status.latitude
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        if self.coordinator.data is None:
-            return None
-        status = self.coordinator.data.get(self._vehicle_id)
-        if status is None:
-            return None
-        return status.longitude
+        status = self._status
+        return None if status is None else status.longitude
 
     @property
     def icon(self) -> str:
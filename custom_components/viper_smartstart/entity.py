@@ -0,0 +1,50 @@
+"""Base entity for Viper SmartStart."""
+
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .api import VehicleStatus
+from .coordinator import ViperCoordinator
+
+
+class ViperEntity(CoordinatorEntity[ViperCoordinator]):
+    """Base entity for a Viper vehicle.
+
+    Looks up the vehicle's status once per coordinator update so entity
+    properties can read it directly, and skips the state write when
+    neither the status nor the update result changed.
+    """
+
+    _attr_has_entity_name = True
+    # Set on entities whose state changes on every update regardless
+    _write_unchanged_status = False
+
+    def __init__(self, coordinator: ViperCoordinator, vehicle_id: str) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._vehicle_id = vehicle_id
+        self._attr_device_info = coordinator.get_device_info(vehicle_id)
+        self._status = self._get_status()
+        self._last_update_success = coordinator.last_update_success
+
+    def _get_status(self) -> VehicleStatus | None:
+        """Get this vehicle's status from the coordinator data."""
+        data = self.coordinator.data
+        return data.get(self._vehicle_id) if data else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Snapshot the vehicle status and write state if it changed."""
+        status = self._get_status()
+        last_update_success = self.coordinator.last_update_success
+        if (
+            not self._write_unchanged_status
+            and status == self._status
+            and last_update_success == self._last_update_success
+        ):
+            return
+        self._status = status
+        self._last_update_success = last_update_success
+        super()._handle_coordinator_update()
@@ -5,6 +5,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain, product
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -17,11 +19,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfElectricPotential
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api import VehicleStatus
 from .const import DOMAIN
 from .coordinator import ViperCoordinator
+from .entity import ViperEntity
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -40,7 +42,7 @@ SENSORS: tuple[ViperSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         suggested_display_precision=2,
-        value_fn=lambda status: status.battery_voltage,
+        value_fn=attrgetter("battery_voltage"),
     ),
 )
 
@@ -53,20 +55,25 @@ async def async_setup_entry(
     """Set up Viper SmartStart sensors."""
     coordinator: ViperCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SensorEntity] = []
-    for vehicle_id in coordinator.get_vehicle_ids():
-        for description in SENSORS:
-            entities.append(ViperSensor(coordinator, vehicle_id, description))
-        entities.append(ViperLastUpdatedSensor(coordinator, vehicle_id))
-
-    async_add_entities(entities)
-
-
-class ViperSensor(CoordinatorEntity[ViperCoordinator], SensorEntity):
+    vehicle_ids = coordinator.get_vehicle_ids()
+    async_add_entities(
+        chain(
+            (
+                ViperSensor(coordinator, vehicle_id, description)
+                for vehicle_id, description in product(vehicle_ids, SENSORS)
+            ),
+            (
+                ViperLastUpdatedSensor(coordinator, vehicle_id)
+                for vehicle_id in vehicle_ids
+            ),
+        )
+    )
+
+
+class ViperSensor(ViperEntity, SensorEntity):
     """Representation of a Viper sensor."""
 
     entity_description: ViperSensorEntityDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -75,30 +82,24 @@ class ViperSensor(CoordinatorEntity[ViperCoordinator], SensorEntity):
         description: ViperSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, vehicle_id)
         self.entity_description = description
-        self._vehicle_id = vehicle_id
         self._attr_unique_id = f"{vehicle_id}_{description.key}"
-        self._attr_device_info = coordinator.get_device_info(vehicle_id)
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
-            return None
-        status = self.coordinator.data.get(self._vehicle_id)
-        if status is None:
-            return None
-        return self.entity_description.value_fn(status)
+        status = self._status
+        return None if status is None else self.entity_description.value_fn(status)
 
 
-class ViperLastUpdatedSensor(CoordinatorEntity[ViperCoordinator], SensorEntity):
+class ViperLastUpdatedSensor(ViperEntity, SensorEntity):
     """Sensor showing when vehicle status was last updated."""
 
-    _attr_has_entity_name = True
     _attr_name = "Last Updated"
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_icon = "mdi:clock-outline"
+    _write_unchanged_status = True
 
     def __init__(
         self,
@@ -106,10 +107,8 @@ class ViperLastUpdatedSensor(CoordinatorEntity[ViperCoordinator], SensorEntity):
         vehicle_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._vehicle_id = vehicle_id
+        super().__init__(coordinator, vehicle_id)
         self._attr_unique_id = f"{vehicle_id}_last_updated"
-        self._attr_device_info = coordinator.get_device_info(vehicle_id)
 
     @property
     def native_value(self) -> datetime | None:
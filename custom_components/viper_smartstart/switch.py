@@ -9,10 +9,10 @@ from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ViperCoordinator
+from .entity import ViperEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,17 +25,15 @@ async def async_setup_entry(
     """Set up Viper SmartStart switches."""
     coordinator: ViperCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[ViperRemoteStartSwitch] = []
-    for vehicle_id in coordinator.get_vehicle_ids():
-        entities.append(ViperRemoteStartSwitch(coordinator, vehicle_id))
+    async_add_entities(
+        ViperRemoteStartSwitch(coordinator, vehicle_id)
+        for vehicle_id in coordinator.get_vehicle_ids()
+    )
 
-    async_add_entities(entities)
 
-
-class ViperRemoteStartSwitch(CoordinatorEntity[ViperCoordinator], SwitchEntity):
+class ViperRemoteStartSwitch(ViperEntity, SwitchEntity):
     """Representation of the remote start switch."""
 
-    _attr_has_entity_name = True
     _attr_name = "Remote Start"
     _attr_icon = "mdi:car-key"
     _attr_device_class = SwitchDeviceClass.SWITCH
@@ -46,37 +44,24 @@ class ViperRemoteStartSwitch(CoordinatorEntity[ViperCoordinator], SwitchEntity):
         vehicle_id: str,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
-        self._vehicle_id = vehicle_id
+        super().__init__(coordinator, vehicle_id)
         self._attr_unique_id = f"{vehicle_id}_remote_start"
-        self._attr_device_info = coordinator.get_device_info(vehicle_id)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if remote starter is active."""
-        if self.coordinator.data is None:
-            return None
-        status = self.coordinator.data.get(self._vehicle_id)
-        if status is None:
-            return None
-        return status.remote_starter_active
+        status = self._status
+        return None if status is None else status.remote_starter_active
 
     @property
     def available(self) -> bool:
         """Return if the switch is available."""
-        if not super().available:
-            return False
-        # Check if we have status data
-        if self.coordinator.data is None:
-            return False
-        status = self.coordinator.data.get(self._vehicle_id)
-        if status is None:
-            return False
-        return True
+        # Also require status data for this vehicle
+        return super().available and self._status is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on remote start."""
-        status = self.coordinator.data.get(self._vehicle_id) if self.coordinator.data else None
+        status = self._status
 
         if status:
             # Don't start if already running (either remote or ignition)
@@ -95,16 +80,17 @@ class ViperRemoteStartSwitch(CoordinatorEntity[ViperCoordinator], SwitchEntity):
         if success:
             # Enable boosted polling to monitor remote start status
             self.coordinator.start_boosted_polling()
-            # Refresh data after command with delay
-            self.hass.async_create_task(
-                self.coordinator.async_refresh_after_action()
+            # Poll until the vehicle reports the new state
+            self.coordinator.schedule_refresh_after_action(
+                self._vehicle_id,
+                lambda status: bool(status and status.remote_starter_active),
             )
         else:
             _LOGGER.warning("Remote start command failed for %s", self._vehicle_id)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off remote start (stop the engine)."""
-        status = self.coordinator.data.get(self._vehicle_id) if self.coordinator.data else None
+        status = self._status
 
         if status:
             # Can only stop if remote started (not if ignition is on from key)
@@ -122,9 +108,10 @@ class ViperRemoteStartSwitch(CoordinatorEntity[ViperCoordinator], SwitchEntity):
         # The 'remote' command toggles - sends same command to stop
         success = await self.coordinator.api.remote_start(self._vehicle_id)
         if success:
-            # Refresh data after command with delay
-            self.hass.async_create_task(
-                self.coordinator.async_refresh_after_action()
+            # Poll until the vehicle reports the new state
+            self.coordinator.schedule_refresh_after_action(
+                self._vehicle_id,
+                lambda status: bool(status and not status.remote_starter_active),
             )
         else:
             _LOGGER.warning("Remote stop command failed for %s", self._vehicle_id)